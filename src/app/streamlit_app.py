@@ -1,15 +1,44 @@
+import io
+
 import streamlit as st
 import pandas as pd
 from pathlib import Path
 from typing import Optional
 
 from eban_stack.risk_checks import flag_overdrafts, summary, OverdraftRule
-from eban_stack.explain import explain_row, explain_summary
-from eban_stack.io import load_budget_data, save_analysis_results
+from eban_stack.explain import explain_series, explain_summary
+from eban_stack.io import save_analysis_results
 
 
 st.set_page_config(page_title="EBAN Budget Guardian", layout="centered")
 
+
+@st.cache_data(show_spinner=False)
+def _analyze(csv_bytes: bytes) -> pd.DataFrame:
+    """Parse and flag an uploaded CSV; cached on the raw bytes so widget
+    interactions that rerun the script skip the heavy work."""
+    df = pd.read_csv(io.BytesIO(csv_bytes), usecols=["balance", "amount"],
+                     dtype={"balance": "float32", "amount": "float32"})
+    return flag_overdrafts(df).reset_index(drop=True)
+
+
+@st.cache_data(show_spinner=False)
+def _preview(csv_bytes: bytes) -> pd.DataFrame:
+    """First 50 rows with explanations — all the render path ever needs."""
+    preview = _analyze(csv_bytes).head(50).copy()
+    preview["explain_text"] = explain_series(preview)
+    return preview
+
+
+@st.cache_data(show_spinner=False)
+def _full_csv(csv_bytes: bytes) -> bytes:
+    """Full result set with explanations, serialized for download."""
+    out = _analyze(csv_bytes)
+    full = out.assign(explain_text=explain_series(out))
+    buf = io.BytesIO()
+    full.to_csv(buf, index=False, lineterminator="\n")
+    return buf.getvalue()
+
 st.title("EBAN Budget Guardian")
 st.caption("Advisory tool only. For education — not financial advice. See Policy → Disclaimers.")
 
@@ -17,33 +46,26 @@ uploaded = st.file_uploader("Upload CSV (columns: balance, amount)", type=["csv"
 
 if uploaded:
     try:
-        # Use load_budget_data for validation; fall back to pandas directly
-        try:
-            df = load_budget_data(uploaded)
-        except Exception:
-            df = pd.read_csv(uploaded)
-
-        # Run risk checks
-        out = flag_overdrafts(df)
-
-        # Add explanations per row
-        out = out.reset_index(drop=True)
-        out["explain_text"] = out.apply(explain_row, axis=1)
+        # Parse + flag is memoized on the uploaded bytes; explanations for
+        # the full frame are only built when a download or save asks
+        csv_bytes = uploaded.getvalue()
+        out = _analyze(csv_bytes)
 
         # Display results
         st.subheader("Results")
-        st.dataframe(out.head(50))
+        st.dataframe(_preview(csv_bytes))
 
         s = summary(out)
         st.metric("Rows", s["rows"])
-        st.metric("Projected overdrafts", s["overdrafts"]) 
+        st.metric("Projected overdrafts", s["overdrafts"])
 
         # Summary text
         st.write(explain_summary(s["rows"], s["overdrafts"]))
 
-        # Download
-        csv_bytes = out.to_csv(index=False).encode("utf-8")
-        st.download_button("Download flagged CSV", csv_bytes, file_name="flagged.csv", mime="text/csv")
+        # Download (explanations for all rows are computed on first click)
+        if st.button("Prepare download"):
+            st.download_button("Download flagged CSV", _full_csv(csv_bytes),
+                               file_name="flagged.csv", mime="text/csv")
 
         # Save option
         if st.button("Save results to disk"):
@@ -7,6 +7,6 @@ __version__ = "0.1.0"
 __author__ = "digitalscorpyun"
 
 from .risk_checks import flag_overdrafts, summary, OverdraftRule
-from .explain import explain_row
+from .explain import explain_row, explain_series
 
-__all__ = ["flag_overdrafts", "summary", "OverdraftRule", "explain_row"]
\ No newline at end of file
+__all__ = ["flag_overdrafts", "summary", "OverdraftRule", "explain_row", "explain_series"]
\ No newline at end of file
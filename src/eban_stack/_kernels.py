@@ -0,0 +1,24 @@
+"""
+Optional numba-accelerated kernels for risk assessment hot paths.
+Importing this module requires numba; callers must guard the import.
+"""
+
+from numba import njit, prange
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def compute_overdraft(balance, amount, projected, flag):
+    """
+    Fill projected balances and overdraft flags in a single fused pass.
+
+    Args:
+        balance: Contiguous float64 array of current balances
+        amount: Contiguous float64 array of transaction amounts
+        projected: Preallocated float64 output array for balance + amount
+        flag: Preallocated bool output array for projected < 0
+    """
+    n = balance.shape[0]
+    for i in prange(n):
+        p = balance[i] + amount[i]
+        projected[i] = p
+        flag[i] = p < 0.0
@@ -3,7 +3,9 @@ Explanation and interpretability functions for budget risk analysis.
 Provides human-readable explanations for risk assessments.
 """
 
+from functools import reduce
 from typing import Dict, Any
+import numpy as np
 import pandas as pd
 
 
@@ -44,6 +46,72 @@ def explain_row(row: pd.Series) -> str:
                 f"${projected:.2f} (above $0)")
 
 
+def _concat(*parts) -> np.ndarray:
+    """Element-wise concatenation of string arrays and scalar separators."""
+    return reduce(np.char.add, parts)
+
+
+def explain_series(df: pd.DataFrame) -> pd.Series:
+    """
+    Generate human-readable explanations for every transaction at once.
+
+    Vectorized equivalent of applying explain_row to each row: builds the
+    explanation strings from NumPy arrays of the relevant columns in a
+    single pass instead of a Python-level row loop.
+
+    Args:
+        df: DataFrame with overdraft analysis results. Expected columns are
+            balance, amount, projected_balance, and overdraft_flag; missing
+            columns fall back to the same defaults as explain_row.
+
+    Returns:
+        Series of explanation strings aligned with the input index
+
+    Example:
+        >>> import pandas as pd
+        >>> df = pd.DataFrame({
+        ...     'balance': [50.0], 'amount': [-75.0],
+        ...     'projected_balance': [-25.0], 'overdraft_flag': [True]
+        ... })
+        >>> explain_series(df).iloc[0]
+        '⚠️ OVERDRAFT RISK: $50.00 balance + $-75.00 transaction = $-25.00 (below $0)'
+    """
+    n = len(df)
+    balance = df['balance'].to_numpy(dtype=np.float64) if 'balance' in df.columns else np.zeros(n)
+    amount = df['amount'].to_numpy(dtype=np.float64) if 'amount' in df.columns else np.zeros(n)
+    if 'projected_balance' in df.columns:
+        projected = df['projected_balance'].to_numpy(dtype=np.float64)
+    else:
+        projected = balance + amount
+    if 'overdraft_flag' in df.columns:
+        is_overdraft = df['overdraft_flag'].to_numpy(dtype=bool)
+    else:
+        is_overdraft = np.zeros(n, dtype=bool)
+
+    balance_str = np.char.mod('%.2f', balance)
+    amount_str = np.char.mod('%.2f', amount)
+    projected_str = np.char.mod('%.2f', projected)
+    action = np.where(amount >= 0, ' deposit', ' withdrawal')
+
+    overdraft_text = _concat(
+        "⚠️ OVERDRAFT RISK: $", balance_str, " balance + $", amount_str,
+        " transaction = $", projected_str, " (below $0)"
+    )
+    safe_text = _concat(
+        "✅ SAFE: $", balance_str, " balance + $", amount_str, action,
+        " = $", projected_str, " (above $0)"
+    )
+
+    text = np.where(is_overdraft, overdraft_text, safe_text)
+    try:
+        # Arrow-backed strings: one contiguous UTF-8 buffer instead of a
+        # Python object per row
+        values = pd.array(text, dtype=pd.StringDtype("pyarrow"))
+    except ImportError:
+        values = text
+    return pd.Series(values, index=df.index)
+
+
 def explain_summary(total_rows: int, overdraft_count: int) -> str:
     """
     Generate summary explanation for overall risk analysis results.
@@ -81,21 +149,25 @@ def generate_recommendations(df: pd.DataFrame) -> Dict[str, Any]:
     Returns:
         Dictionary containing personalized recommendations and insights
     """
-    overdrafts = df[df.get('overdraft_flag', False)]
-    
+    if 'overdraft_flag' in df.columns:
+        flag = df['overdraft_flag'].to_numpy(dtype=bool)
+    else:
+        flag = np.zeros(len(df), dtype=bool)
+    overdraft_count = int(flag.sum())
+
     recommendations = {
         'priority': 'low',
         'actions': [],
         'insights': []
     }
-    
-    if len(overdrafts) == 0:
+
+    if overdraft_count == 0:
         recommendations['actions'].append("Continue current spending patterns - no immediate risks detected.")
         recommendations['insights'].append("Your transactions show good balance management.")
         return recommendations
-    
+
     # High risk scenario
-    if len(overdrafts) > len(df) * 0.2:  # More than 20% overdrafts
+    if overdraft_count > len(df) * 0.2:  # More than 20% overdrafts
         recommendations['priority'] = 'high'
         recommendations['actions'].extend([
             "⚠️ Consider reducing discretionary spending immediately",
@@ -109,8 +181,9 @@ def generate_recommendations(df: pd.DataFrame) -> Dict[str, Any]:
             "Consider timing large expenses after deposits clear"
         ])
     
-    # Specific insights
-    avg_overdraft = overdrafts['projected_balance'].mean() if len(overdrafts) > 0 else 0
+    # Specific insights; mask the one column we need instead of filtering
+    # the whole DataFrame
+    avg_overdraft = float(df['projected_balance'].to_numpy()[flag].mean())
     recommendations['insights'].append(
         f"Average projected overdraft amount: ${abs(avg_overdraft):.2f}"
     )
@@ -0,0 +1,20 @@
+import pandas as pd
+from eban_stack.explain import explain_row, explain_series
+from eban_stack.risk_checks import flag_overdrafts
+
+
+def test_explain_series_matches_explain_row():
+    # Vectorized path must produce exactly what the row-wise apply did
+    df = flag_overdrafts(pd.DataFrame({
+        "balance": [100.0, 50.0, 0.0],
+        "amount": [-20.0, -60.0, 30.0],
+    }))
+    vectorized = explain_series(df)
+    row_wise = df.apply(explain_row, axis=1)
+    assert (vectorized == row_wise).all()
+
+
+def test_explain_series_defaults_without_flag_columns():
+    # Missing columns fall back to the same defaults as explain_row
+    df = pd.DataFrame({"balance": [10.0], "amount": [-3.0]})
+    assert explain_series(df).iloc[0].startswith("✅ SAFE")
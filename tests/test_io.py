@@ -0,0 +1,39 @@
+import pandas as pd
+import pytest
+from eban_stack.io import load_budget_data, save_analysis_results
+from eban_stack.risk_checks import flag_overdrafts
+
+
+def test_load_budget_data_missing_columns(tmp_path):
+    path = tmp_path / "partial.csv"
+    path.write_text("balance\n100\n")
+    with pytest.raises(ValueError, match="Missing required columns"):
+        load_budget_data(str(path))
+
+
+def test_load_budget_data_rejects_non_numeric(tmp_path):
+    # dtype hints make non-numeric cells a hard error, not a silent NaN
+    path = tmp_path / "bad.csv"
+    path.write_text("balance,amount\n100,oops\n")
+    with pytest.raises(ValueError, match="Error reading CSV file"):
+        load_budget_data(str(path))
+
+
+def test_save_analysis_results_roundtrip(tmp_path):
+    df = flag_overdrafts(pd.DataFrame({"balance": [100.0, 50.0], "amount": [-20.0, -60.0]}))
+    out_path = tmp_path / "results.csv"
+    save_analysis_results(df, str(out_path))
+
+    saved = pd.read_csv(out_path)
+    assert saved["overdraft_flag"].tolist() == [False, True]
+    assert saved["projected_balance"].tolist() == [80.0, -10.0]
+    assert "explain_text" in saved.columns
+
+    text = out_path.read_text()
+    try:
+        import pyarrow  # noqa: F401
+        # pyarrow writer emits lowercase booleans and unpadded numbers
+        assert "80,false" in text
+    except ImportError:
+        # pandas fallback keeps %.2f padding and Python-style booleans
+        assert "80.00,False" in text